@@ -0,0 +1,75 @@
+"""Measure CPU throughput of the eager and fast execution modes of SimpleNN."""
+
+import argparse
+import time
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from torch.utils.data import DataLoader, TensorDataset
+from experiments import (
+    SimpleNN,
+    evaluate,
+    intra_op_threads,
+    quantize_model,
+    train_epoch,
+)
+
+
+def make_loader(n_samples, batch_size):
+    # Synthetic MNIST-shaped data, so no download is needed
+    images = torch.rand(n_samples, 1, 28, 28)
+    labels = torch.randint(0, 10, (n_samples,))
+    return DataLoader(TensorDataset(images, labels), batch_size=batch_size)
+
+
+def throughput(fn, n_samples, repeats):
+    """Return samples per second of fn, after one warm-up run."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return n_samples * repeats / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--hidden-size", type=int, default=128)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--num-threads", type=int, default=None)
+    parser.add_argument("--compile", action="store_true", help="Include compiled runs")
+    args = parser.parse_args()
+
+    loader = make_loader(args.samples, args.batch_size)
+    criterion = nn.NLLLoss()
+    model = SimpleNN(args.hidden_size)
+    optimizer = optim.SGD(model.parameters(), lr=0.01)
+
+    def train(run_model, fast):
+        return lambda: train_epoch(run_model, loader, criterion, optimizer, fast=fast)
+
+    def infer(run_model, fast):
+        return lambda: evaluate(run_model, loader, criterion, fast=fast)
+
+    runs = {
+        "train eager": train(model, False),
+        "eval eager": infer(model, False),
+        "train fast": train(model, True),
+        "eval fast": infer(model, True),
+        "eval fast int8": infer(quantize_model(model), True),
+    }
+    if args.compile:
+        compiled = torch.compile(model)
+        runs["train fast compiled"] = train(compiled, True)
+
+    # All modes run on the same thread count, so only the code paths differ
+    with intra_op_threads(args.num_threads):
+        print(f"Threads: {torch.get_num_threads()}")
+        for name, fn in runs.items():
+            rate = throughput(fn, args.samples, args.repeats)
+            print(f"{name:<22}{rate:>12,.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
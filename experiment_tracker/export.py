@@ -0,0 +1,239 @@
+# experiment_tracker/export.py
+import argparse
+import io
+import json
+from pathlib import Path
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+from sqlalchemy import func, Integer, Float, String, DateTime, JSON
+from .database import init_db, Experiment, TrainingMetric, EvaluationMetric
+
+TABLES = {
+    "experiments": Experiment,
+    "training_metrics": TrainingMetric,
+    "evaluation_metrics": EvaluationMetric,
+}
+FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "csv": ".csv",
+}
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Native pandas dtypes for the column types used in the database schema
+_DTYPES = {
+    Integer: "Int64",
+    Float: "float64",
+    String: "string",
+    DateTime: "datetime64[ns]",
+}
+
+
+def _column_dtype(column):
+    for sql_type, dtype in _DTYPES.items():
+        if isinstance(column.type, sql_type):
+            return dtype
+    raise TypeError(f"No export dtype for column {column.name} ({column.type})")
+
+
+def _infer_config_dtypes(session, max_id, chunk_size):
+    """Scan experiment configs up to max_id for their keys and a dtype per key."""
+    seen_types = {}
+    last_id = 0
+    while True:
+        rows = (
+            session.query(Experiment.id, Experiment.config)
+            .filter(Experiment.id > last_id, Experiment.id <= max_id)
+            .order_by(Experiment.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+        for _, config in rows:
+            for key, value in config.items():
+                types = seen_types.setdefault(key, set())
+                if value is not None:
+                    types.add(type(value))
+        last_id = rows[-1].id
+
+    dtypes = {}
+    for key, types in seen_types.items():
+        if types == {bool}:
+            dtypes[key] = "boolean"
+        elif types == {int}:
+            dtypes[key] = "Int64"
+        elif types and types <= {int, float}:
+            dtypes[key] = "float64"
+        else:
+            dtypes[key] = "string"
+    return dtypes
+
+
+def _flatten_config(configs, config_dtypes):
+    """Turn a sequence of config dicts into one typed column per config key."""
+    columns = {}
+    for key, dtype in config_dtypes.items():
+        values = [config.get(key) for config in configs]
+        if dtype == "string":
+            values = [
+                v if v is None or isinstance(v, str) else json.dumps(v) for v in values
+            ]
+        columns[f"config.{key}"] = pd.array(values, dtype=dtype)
+    return columns
+
+
+def _to_frame(rows, plain_columns, json_columns, config_dtypes):
+    """Build a typed DataFrame from query rows, which may be empty."""
+    data = {
+        c.name: pd.array([row._mapping[c] for row in rows], dtype=_column_dtype(c))
+        for c in plain_columns
+    }
+    for c in json_columns:
+        configs = [row._mapping[c] or {} for row in rows]
+        data.update(_flatten_config(configs, config_dtypes))
+    return pd.DataFrame(data)
+
+
+def iter_table_chunks(session, table, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield a table as DataFrames of at most chunk_size rows.
+
+    Columns keep their native dtypes and every chunk shares the same schema.
+    For the experiments table, config keys are flattened into `config.<key>`
+    columns. An empty table yields a single empty DataFrame, so exports of it
+    still carry the schema.
+
+    Only rows that exist when the export starts are included, so rows written
+    by a running tracker cannot disagree with the inferred config dtypes.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    model = TABLES[table]
+    columns = list(model.__table__.columns)
+    json_columns = [c for c in columns if isinstance(c.type, JSON)]
+    plain_columns = [c for c in columns if not isinstance(c.type, JSON)]
+    max_id = session.query(func.max(model.id)).scalar() or 0
+    config_dtypes = (
+        _infer_config_dtypes(session, max_id, chunk_size) if json_columns else {}
+    )
+
+    last_id = None
+    while True:
+        rows = (
+            session.query(*columns)
+            .filter(model.id > (last_id or 0), model.id <= max_id)
+            .order_by(model.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+        yield _to_frame(rows, plain_columns, json_columns, config_dtypes)
+        last_id = rows[-1].id
+
+    if last_id is None:
+        yield _to_frame([], plain_columns, json_columns, config_dtypes)
+
+
+def iter_export_bytes(session, table, fmt="parquet", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield a table serialized to fmt as a stream of byte chunks.
+
+    Only one chunk of rows is held in memory at a time, which makes this
+    suitable for streaming HTTP responses.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    buf = io.BytesIO()
+
+    def drain():
+        data = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return data
+
+    writer = None
+    for i, df in enumerate(iter_table_chunks(session, table, chunk_size)):
+        if fmt == "csv":
+            yield df.to_csv(index=False, header=i == 0).encode("utf-8")
+            continue
+
+        batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+        if writer is None:
+            if fmt == "parquet":
+                writer = pq.ParquetWriter(buf, batch.schema)
+            else:
+                writer = pa.ipc.new_stream(buf, batch.schema)
+        writer.write_batch(batch)
+        yield drain()
+
+    if writer is not None:
+        writer.close()
+        yield drain()
+
+
+def export_table(session, table, path, fmt="parquet", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write a table to path in chunks. Returns the path written to."""
+    path = Path(path)
+    with open(path, "wb") as f:
+        for data in iter_export_bytes(session, table, fmt, chunk_size):
+            f.write(data)
+    return path
+
+
+def export_all(
+    session, output_dir, fmt="parquet", chunk_size=DEFAULT_CHUNK_SIZE, tables=None
+):
+    """Export tables (default: all) to output_dir as <table><ext>.
+
+    Returns the paths written to.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return [
+        export_table(
+            session, table, output_dir / f"{table}{FORMATS[fmt]}", fmt, chunk_size
+        )
+        for table in tables or TABLES
+    ]
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bulk export experiment tracker tables."
+    )
+    parser.add_argument("output_dir", help="Directory to write exported files to")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument(
+        "--table",
+        choices=TABLES,
+        action="append",
+        help="Table to export, may be repeated (default: all tables)",
+    )
+    parser.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--db-url", default="sqlite:///experiments.db")
+    args = parser.parse_args(argv)
+
+    session = init_db(args.db_url)
+    try:
+        paths = export_all(
+            session, args.output_dir, args.format, args.chunk_size, args.table
+        )
+        for path in paths:
+            print(f"Exported {path.stem} to {path}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
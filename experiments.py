@@ -1,4 +1,5 @@
 import os
+from contextlib import contextmanager
 from pathlib import Path
 import torch
 import torch.nn as nn
@@ -64,6 +65,20 @@ def create_blurred_dataset(input_path, output_path, sigma=2):
     save_dataset(output_path, blurred_dataset)
 
 
+@contextmanager
+def intra_op_threads(num_threads=None):
+    """Run torch ops on num_threads threads, restoring the previous count on exit.
+
+    None keeps the current count, which torch defaults to the physical cores.
+    """
+    previous = torch.get_num_threads()
+    torch.set_num_threads(num_threads or previous)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
 def train_model(config, tracker):
     full_dataset = load_dataset(config["data_path"], config["max_samples"])
     train_size = int(config["data_split_ratio"] * len(full_dataset))
@@ -79,9 +94,16 @@ def train_model(config, tracker):
     criterion = nn.NLLLoss()
     optimizer = optim.SGD(model.parameters(), lr=config["learning_rate"])
 
+    fast = config["execution_mode"] == "fast"
+    # Compiled module shares parameters with model, which is kept for checkpoints
+    run_model = torch.compile(model) if fast and config["compile_model"] else model
+
     for epoch in range(config["max_epochs"]):
-        train_metrics = train_epoch(model, train_loader, criterion, optimizer)
-        val_metrics = evaluate(model, val_loader, criterion)
+        with intra_op_threads(config["num_threads"]):
+            train_metrics = train_epoch(
+                run_model, train_loader, criterion, optimizer, fast=fast
+            )
+            val_metrics = evaluate(run_model, val_loader, criterion, fast=fast)
 
         # Log training metrics
         tracker.log_training_metrics(
@@ -108,8 +130,10 @@ def train_model(config, tracker):
     )
 
 
-def train_epoch(model, dataloader, criterion, optimizer):
+def train_epoch(model, dataloader, criterion, optimizer, fast=False):
     model.train()
+    if fast:
+        return _train_epoch_fast(model, dataloader, criterion, optimizer)
     running_loss = 0
     correct = 0
     total = 0
@@ -130,8 +154,31 @@ def train_epoch(model, dataloader, criterion, optimizer):
     return {"loss": running_loss / total, "accuracy": correct / total}
 
 
-def evaluate(model, dataloader, criterion):
+def _train_epoch_fast(model, dataloader, criterion, optimizer):
+    """Like train_epoch, but accumulate metrics on-tensor to avoid a sync per batch."""
+    running_loss = torch.zeros((), dtype=torch.float64)
+    correct = torch.zeros((), dtype=torch.long)
+    total = 0
+
+    for inputs, labels in dataloader:
+        outputs = model(inputs)
+        loss = criterion(outputs, labels)
+
+        optimizer.zero_grad(set_to_none=True)
+        loss.backward()
+        optimizer.step()
+
+        running_loss += loss.detach().double() * inputs.size(0)
+        correct += (outputs.detach().argmax(1) == labels).sum()
+        total += labels.size(0)
+
+    return {"loss": running_loss.item() / total, "accuracy": correct.item() / total}
+
+
+def evaluate(model, dataloader, criterion, fast=False):
     model.eval()
+    if fast:
+        return _evaluate_fast(model, dataloader, criterion)
     running_loss = 0
     correct = 0
     total = 0
@@ -148,14 +195,43 @@ def evaluate(model, dataloader, criterion):
     return {"loss": running_loss / total, "accuracy": correct / total}
 
 
-def evaluate_model(model_path, data_path, dataset_name, tracker):
+def _evaluate_fast(model, dataloader, criterion):
+    """Like evaluate, but under inference_mode with on-tensor metric accumulation."""
+    running_loss = torch.zeros((), dtype=torch.float64)
+    correct = torch.zeros((), dtype=torch.long)
+    total = 0
+
+    with torch.inference_mode():
+        for inputs, labels in dataloader:
+            outputs = model(inputs)
+            running_loss += criterion(outputs, labels).double() * inputs.size(0)
+            correct += (outputs.argmax(1) == labels).sum()
+            total += labels.size(0)
+
+    return {"loss": running_loss.item() / total, "accuracy": correct.item() / total}
+
+
+def quantize_model(model):
+    """Dynamically quantize the linear layers of a model to int8 for inference."""
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+
+def evaluate_model(model_path, data_path, dataset_name, tracker, config):
     checkpoint = torch.load(model_path)
     model = SimpleNN(checkpoint["hidden_size"])
     model.load_state_dict(checkpoint["model_state_dict"])
 
+    fast = config["execution_mode"] == "fast"
+    if fast and config["quantize_eval"]:
+        model = quantize_model(model)
+
+    # Per-sample metrics do not depend on batch size, so batch up inference
     test_dataset = load_dataset(data_path)
-    test_loader = DataLoader(test_dataset, batch_size=1, shuffle=True)
-    metrics = evaluate(model, test_loader, nn.NLLLoss())
+    test_loader = DataLoader(
+        test_dataset, batch_size=config["batch_size"], shuffle=True
+    )
+    with intra_op_threads(config["num_threads"]):
+        metrics = evaluate(model, test_loader, nn.NLLLoss(), fast=fast)
 
     # Log evaluation metrics
     tracker.log_evaluation_metrics(
@@ -176,6 +252,15 @@ def make_configs(mnist_train, mnist_train_blurred):
         "data_split_ratio": 0.8,
         "max_epochs": 10,
         "max_samples": None,
+        # Intra-op threads, None for torch's default
+        "num_threads": None,
+        # Execution mode, "eager" or "fast". The options below apply to "fast" only
+        "execution_mode": "eager",
+        # Compile the model for the training loop only, test evaluation is eager
+        "compile_model": False,
+        # Uses torch.ao.quantization.quantize_dynamic, which is deprecated and
+        # warns on every call in recent torch releases
+        "quantize_eval": False,
     }
 
     # Config variants
@@ -217,6 +302,9 @@ if __name__ == "__main__":
 
     # Start training and evaluation
     for config_name, config in configs.items():
+        # Record the thread count actually used
+        config["num_threads"] = config["num_threads"] or torch.get_num_threads()
+
         # Start tracking this experiment
         tracker.start_experiment(name=config_name, config=config)
 
@@ -229,12 +317,14 @@ if __name__ == "__main__":
             data_path=mnist_test,
             dataset_name="test",
             tracker=tracker,
+            config=config,
         )
         evaluate_model(
             model_path=config["output_path"],
             data_path=mnist_test_blurred,
             dataset_name="test_blurred",
             tracker=tracker,
+            config=config,
         )
 
         # End experiment
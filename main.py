@@ -1,6 +1,12 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import HTMLResponse, StreamingResponse
 from experiment_tracker.database import init_db, Experiment
+from experiment_tracker.export import (
+    TABLES,
+    FORMATS,
+    DEFAULT_CHUNK_SIZE,
+    iter_export_bytes,
+)
 from experiment_tracker.inspect import DBInspector
 import matplotlib
 import matplotlib.pyplot as plt
@@ -15,6 +21,15 @@ app = FastAPI(
     title="Experiment Tracker API", description="API for managing experiments"
 )
 
+# Media types of the bulk export formats
+EXPORT_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "csv": "text/csv",
+}
+# Upper bound on rows per export chunk, which bounds the memory of a download
+MAX_EXPORT_CHUNK_SIZE = 100_000
+
 # Initialize database connection
 db_session = init_db()
 inspector = DBInspector(db_session)
@@ -60,6 +75,25 @@ def read_evaluation_metrics(experiment_id: int):
     return experiment.evaluation_metrics
 
 
+@app.get("/api/export/{table}")
+def export_table(
+    table: str,
+    format: str = "parquet",
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_EXPORT_CHUNK_SIZE),
+):
+    """Stream a whole table as a Parquet, Arrow or CSV download"""
+    if table not in TABLES:
+        raise HTTPException(status_code=404, detail="Table not found")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported export format")
+    filename = f"{table}{FORMATS[format]}"
+    return StreamingResponse(
+        iter_export_bytes(db_session, table, format, chunk_size),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # HTML responses
 @app.get("/experiments", response_class=HTMLResponse)
 def tabulate_experiments():